@@ -5,144 +5,199 @@ AI-driven pet health triage without medical diagnoses
 
 import json
 import re
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import sys
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Any, NamedTuple, Optional, Tuple
+from functools import lru_cache
 
-# Emergency symptoms requiring immediate vet care
-EMERGENCY_SYMPTOMS = [
+# Emergency symptoms requiring immediate vet care. Labels are interned so
+# set/dict lookups on them can hit on identity; multi-word literals are not
+# interned by the compiler.
+EMERGENCY_SYMPTOMS = [sys.intern(s) for s in [
     'bleeding', 'seizure', 'collapse', 'unconscious', 'difficulty breathing',
     'pale gums', 'poisoning', 'not eating 24h', 'severe pain'
-]
+]]
 
-# Medium urgency symptoms
-MEDIUM_SYMPTOMS = [
+# Medium urgency symptoms (interned likewise)
+MEDIUM_SYMPTOMS = [sys.intern(s) for s in [
     'vomiting', 'diarrhea', 'limping', 'lethargy', 'loss of appetite',
     'swelling', 'coughing', 'straining to urinate'
-]
+]]
+
+EMERGENCY_SET = frozenset(EMERGENCY_SYMPTOMS)
+MEDIUM_SET = frozenset(MEDIUM_SYMPTOMS)
+
+# Everyday phrasings mapped to a canonical symptom label
+SYMPTOM_PATTERNS = {
+    'vomiting': ['vomit', 'throwing up', 'sick'],
+    'diarrhea': ['loose stool', 'runny', 'diarrhea'],
+    'lethargy': ['tired', 'sleepy', 'inactive', 'lethargic'],
+    'loss_of_appetite': ['not eating', 'won\'t eat', 'no appetite']
+}
+
+def _build_symptom_matcher():
+    """Compile every symptom keyword into one named-group pattern"""
+    keywords_by_label = {symptom: [symptom] for symptom in EMERGENCY_SYMPTOMS + MEDIUM_SYMPTOMS}
+    for symptom, keywords in SYMPTOM_PATTERNS.items():
+        keywords_by_label.setdefault(symptom, []).extend(keywords)
+    
+    # Emergency labels are tried first so 'not eating 24h' wins over 'not eating'
+    groups, labels, bits = [], {}, {}
+    for i, (symptom, keywords) in enumerate(keywords_by_label.items()):
+        keywords = sorted(dict.fromkeys(keywords), key=len, reverse=True)
+        groups.append(f"(?P<s{i}>{'|'.join(map(re.escape, keywords))})")
+        labels[f"s{i}"] = symptom
+        bits[f"s{i}"] = 1 << i
+    # Keywords must start on a word boundary ('sick' should not match 'homesick')
+    # but may run on into inflections such as 'collapsed' or 'vomited'
+    return re.compile(r'\b(?:' + '|'.join(groups) + ')'), labels, bits
+
+_SYMPTOM_RE, _SYMPTOM_LABELS, _SYMPTOM_BITS = _build_symptom_matcher()
+
+# Bitmasks over _SYMPTOM_BITS used to classify a scan's hits
+EMERGENCY_MASK = sum(bit for group, bit in _SYMPTOM_BITS.items() if _SYMPTOM_LABELS[group] in EMERGENCY_SET)
+MEDIUM_MASK = sum(bit for group, bit in _SYMPTOM_BITS.items() if _SYMPTOM_LABELS[group] in MEDIUM_SET)
+
+# Recommended actions per urgency level, shared by every triage result
+_HIGH_ACTIONS = (
+    "Seek immediate veterinary care",
+    "Keep pet calm and comfortable",
+    "Do not give food or water unless instructed",
+    "Call vet clinic ahead of arrival"
+)
+
+_MEDIUM_ACTIONS = (
+    "Schedule vet appointment within 24-48 hours",
+    "Monitor symptoms closely",
+    "Ensure pet has access to fresh water",
+    "Keep pet in quiet, comfortable area"
+)
+
+_LOW_ACTIONS = (
+    "Monitor pet for changes",
+    "Maintain normal feeding schedule",
+    "Consider vet consultation if symptoms worsen",
+    "Document any changes in behavior"
+)
+
+_ACTIONS_BY_URGENCY = {'HIGH': _HIGH_ACTIONS, 'MEDIUM': _MEDIUM_ACTIONS, 'LOW': _LOW_ACTIONS}
+
+_VET_TYPE_BY_URGENCY = {'HIGH': 'emergency', 'MEDIUM': 'general', 'LOW': 'monitor'}
+
+# Daily wellness tasks; read-only views so shared entries cannot be edited by callers
+_BASE_TASKS = (
+    MappingProxyType({"task": "Check and refill water bowl", "duration": "2 min", "category": "hydration"}),
+    MappingProxyType({"task": "Quick health visual check", "duration": "3 min", "category": "monitoring"}),
+    MappingProxyType({"task": "Basic grooming (brush/pet)", "duration": "5 min", "category": "grooming"}),
+    MappingProxyType({"task": "Short play or training session", "duration": "10 min", "category": "mental"})
+)
+_CAT_TASK = MappingProxyType({"task": "Clean litter box", "duration": "3 min", "category": "hygiene"})
+_DOG_TASK = MappingProxyType({"task": "Brief walk or outdoor time", "duration": "15 min", "category": "exercise"})
 
-@dataclass
-class TriageResult:
+# Four tasks per species: the species-specific task takes the last base slot
+_TASKS_BY_SPECIES = {
+    'cat': _BASE_TASKS[:3] + (_CAT_TASK,),
+    'dog': _BASE_TASKS[:3] + (_DOG_TASK,)
+}
+
+DISCLAIMER = "⚠️ Not medical advice. Always consult a veterinarian for proper diagnosis."
+
+class TriageResult(NamedTuple):
     urgency: str  # HIGH, MEDIUM, LOW
-    symptoms: List[str]
-    actions: List[str]
+    symptoms: Tuple[str, ...]
+    actions: Tuple[str, ...]
     vet_type: str  # emergency, general, monitor
-    disclaimer: str
+    
+    # Left unannotated so it stays a class attribute rather than a tuple field
+    disclaimer = DISCLAIMER
+
+def _normalize(description: str) -> str:
+    """Lowercase and collapse whitespace so trivially different inputs compare equal"""
+    return ' '.join(description.lower().split())
+
+def _scan(text: str) -> Tuple[List[str], str]:
+    """Extract symptoms and their urgency level in a single pass over _normalize()d text"""
+    found_symptoms: Dict[str, None] = {}  # ordered set, first mention wins
+    hits = 0
+    
+    for match in _SYMPTOM_RE.finditer(text):
+        group = match.lastgroup
+        found_symptoms[_SYMPTOM_LABELS[group]] = None
+        hits |= _SYMPTOM_BITS[group]
+    
+    return list(found_symptoms) or ['general_concern'], _urgency_from_mask(hits)
+
+def _urgency_from_mask(hits: int) -> str:
+    """Map a bitmask of matched symptoms to an urgency level"""
+    return 'HIGH' if hits & EMERGENCY_MASK else 'MEDIUM' if hits & MEDIUM_MASK else 'LOW'
+
+def _generate_actions(urgency: str) -> Tuple[str, ...]:
+    """Safe action recommendations for an urgency level"""
+    return _ACTIONS_BY_URGENCY.get(urgency, _LOW_ACTIONS)
+
+def _triage_pipeline(text: str) -> TriageResult:
+    """Triage a normalized description without caching"""
+    symptoms, urgency = _scan(text)
+    
+    return TriageResult(
+        urgency=urgency,
+        symptoms=tuple(symptoms),
+        actions=_generate_actions(urgency),
+        vet_type=_VET_TYPE_BY_URGENCY[urgency]
+    )
+
+# Cached pipeline for interactive triage; results are shared between callers
+_triage_impl = lru_cache(maxsize=1024)(_triage_pipeline)
 
 class PetVetAssist:
     """Clean, minimal PetVet triage system"""
     
+    disclaimer: ClassVar[str] = DISCLAIMER
+    
     def __init__(self, mock_mode: bool = True):
         self.mock_mode = mock_mode
-        self.disclaimer = "⚠️ Not medical advice. Always consult a veterinarian for proper diagnosis."
     
     def extract_symptoms(self, description: str) -> List[str]:
         """Extract symptoms from text description"""
-        text = description.lower()
-        found_symptoms = []
-        
-        # Check emergency symptoms first
-        for symptom in EMERGENCY_SYMPTOMS:
-            if symptom.replace(' ', '') in text.replace(' ', ''):
-                found_symptoms.append(symptom)
-        
-        # Check medium symptoms
-        for symptom in MEDIUM_SYMPTOMS:
-            if symptom.replace(' ', '') in text.replace(' ', ''):
-                found_symptoms.append(symptom)
-        
-        # Basic symptom patterns
-        patterns = {
-            'vomiting': ['vomit', 'throwing up', 'sick'],
-            'diarrhea': ['loose stool', 'runny', 'diarrhea'],
-            'lethargy': ['tired', 'sleepy', 'inactive', 'lethargic'],
-            'loss_of_appetite': ['not eating', 'won\'t eat', 'no appetite']
-        }
-        
-        for symptom, keywords in patterns.items():
-            if any(keyword in text for keyword in keywords):
-                found_symptoms.append(symptom)
-        
-        return list(set(found_symptoms)) or ['general_concern']
+        return _scan(_normalize(description))[0]
     
     def assess_urgency(self, symptoms: List[str]) -> str:
         """Determine urgency level"""
-        # Check for emergency symptoms
-        for symptom in symptoms:
-            if any(emergency in symptom for emergency in EMERGENCY_SYMPTOMS):
-                return 'HIGH'
-        
-        # Check for medium symptoms
-        for symptom in symptoms:
-            if any(medium in symptom for medium in MEDIUM_SYMPTOMS):
-                return 'MEDIUM'
-        
+        # Each check is one C-level pass over the symptoms with O(1) set lookups,
+        # and the HIGH check short-circuits before the MEDIUM one
+        if not EMERGENCY_SET.isdisjoint(symptoms):
+            return 'HIGH'
+        if not MEDIUM_SET.isdisjoint(symptoms):
+            return 'MEDIUM'
         return 'LOW'
     
-    def generate_actions(self, urgency: str, symptoms: List[str]) -> List[str]:
+    def generate_actions(self, urgency: str, symptoms: List[str]) -> Tuple[str, ...]:
         """Generate safe action recommendations"""
-        if urgency == 'HIGH':
-            return [
-                "Seek immediate veterinary care",
-                "Keep pet calm and comfortable",
-                "Do not give food or water unless instructed",
-                "Call vet clinic ahead of arrival"
-            ]
-        
-        elif urgency == 'MEDIUM':
-            return [
-                "Schedule vet appointment within 24-48 hours",
-                "Monitor symptoms closely",
-                "Ensure pet has access to fresh water",
-                "Keep pet in quiet, comfortable area"
-            ]
-        
-        else:  # LOW
-            return [
-                "Monitor pet for changes",
-                "Maintain normal feeding schedule",
-                "Consider vet consultation if symptoms worsen",
-                "Document any changes in behavior"
-            ]
+        return _generate_actions(urgency)
     
     def suggest_vet_type(self, urgency: str) -> str:
         """Recommend type of veterinary care"""
-        if urgency == 'HIGH':
-            return 'emergency'
-        elif urgency == 'MEDIUM':
-            return 'general'
-        else:
-            return 'monitor'
+        return _VET_TYPE_BY_URGENCY.get(urgency, 'monitor')
     
     def triage(self, description: str) -> TriageResult:
         """Complete triage assessment"""
-        symptoms = self.extract_symptoms(description)
-        urgency = self.assess_urgency(symptoms)
-        actions = self.generate_actions(urgency, symptoms)
-        vet_type = self.suggest_vet_type(urgency)
-        
-        return TriageResult(
-            urgency=urgency,
-            symptoms=symptoms,
-            actions=actions,
-            vet_type=vet_type,
-            disclaimer=self.disclaimer
-        )
+        return _triage_impl(_normalize(description))
+    
+    def triage_batch(self, descriptions: List[str]) -> List[TriageResult]:
+        """Triage many descriptions at once, e.g. a log of historical case notes"""
+        # Dedupe within the batch but bypass the shared cache, so one bulk
+        # import does not evict every interactive entry
+        texts = [_normalize(description) for description in descriptions]
+        results = {text: _triage_pipeline(text) for text in dict.fromkeys(texts)}
+        return [results[text] for text in texts]
     
     def daily_tasks(self, species: str = 'dog') -> List[Dict[str, str]]:
         """Generate daily wellness tasks"""
-        base_tasks = [
-            {"task": "Check and refill water bowl", "duration": "2 min", "category": "hydration"},
-            {"task": "Quick health visual check", "duration": "3 min", "category": "monitoring"},
-            {"task": "Basic grooming (brush/pet)", "duration": "5 min", "category": "grooming"},
-            {"task": "Short play or training session", "duration": "10 min", "category": "mental"}
-        ]
-        
-        if species == 'cat':
-            base_tasks.append({"task": "Clean litter box", "duration": "3 min", "category": "hygiene"})
-        elif species == 'dog':
-            base_tasks.append({"task": "Brief walk or outdoor time", "duration": "15 min", "category": "exercise"})
-        
-        return base_tasks[:4]  # Return 4 tasks
+        # Fresh copies at the boundary so callers can edit them without touching the shared table
+        return [dict(task) for task in _TASKS_BY_SPECIES.get(species, _BASE_TASKS)]
+
+# Shared instance for the demo helpers; all heavy tables live at module scope
+_DEFAULT_ASSISTANT = PetVetAssist()
 
 # Test cases for validation
 TEST_CASES = [
@@ -165,59 +220,72 @@ TEST_CASES = [
     {
         "description": "My cat has been coughing occasionally",
         "expected_urgency": "MEDIUM"
+    },
+    {
+        "description": "My dog seems homesick since we moved",
+        "expected_urgency": "LOW"  # 'sick' only counts at the start of a word
+    },
+    {
+        "description": "My dog suddenly collapsed in the yard",
+        "expected_urgency": "HIGH"  # inflected forms still match their keyword
     }
 ]
 
-def run_tests():
+def run_tests(assistant: PetVetAssist = _DEFAULT_ASSISTANT):
     """Run validation tests"""
-    assistant = PetVetAssist()
     results = {"passed": 0, "total": len(TEST_CASES)}
     
-    print("🧪 Running PetVet Assist Tests")
-    print("=" * 40)
+    out: List[str] = ["🧪 Running PetVet Assist Tests", "=" * 40]
+    
+    triaged = assistant.triage_batch([case["description"] for case in TEST_CASES])
     
-    for i, case in enumerate(TEST_CASES, 1):
-        result = assistant.triage(case["description"])
+    for i, (case, result) in enumerate(zip(TEST_CASES, triaged), 1):
         passed = result.urgency == case["expected_urgency"]
         
-        print(f"\nTest {i}: {'✅' if passed else '❌'}")
-        print(f"Input: {case['description'][:50]}...")
-        print(f"Expected: {case['expected_urgency']} | Got: {result.urgency}")
+        out.append(f"\nTest {i}: {'✅' if passed else '❌'}")
+        out.append(f"Input: {case['description'][:50]}...")
+        out.append(f"Expected: {case['expected_urgency']} | Got: {result.urgency}")
         
         if passed:
             results["passed"] += 1
     
     accuracy = results["passed"] / results["total"] * 100
-    print(f"\n📊 Results: {results['passed']}/{results['total']} ({accuracy:.1f}% accuracy)")
+    out.append(f"\n📊 Results: {results['passed']}/{results['total']} ({accuracy:.1f}% accuracy)")
+    
+    # One write instead of a print (and stdout lock) per line
+    sys.stdout.write('\n'.join(out) + '\n')
     return results
 
-def demo_consultation(description: str):
+def demo_consultation(description: str, assistant: PetVetAssist = _DEFAULT_ASSISTANT):
     """Demonstrate complete consultation"""
-    assistant = PetVetAssist()
     result = assistant.triage(description)
     
-    print("🐾 PetVet Assist Consultation")
-    print("=" * 50)
-    print(f"📝 Description: {description}")
-    print(f"\n🔍 Symptoms Found: {', '.join(result.symptoms)}")
-    print(f"🚨 Urgency Level: {result.urgency}")
-    print(f"🏥 Recommended Care: {result.vet_type.title()}")
+    out: List[str] = [
+        "🐾 PetVet Assist Consultation",
+        "=" * 50,
+        f"📝 Description: {description}",
+        f"\n🔍 Symptoms Found: {', '.join(result.symptoms)}",
+        f"🚨 Urgency Level: {result.urgency}",
+        f"🏥 Recommended Care: {result.vet_type.title()}"
+    ]
     
-    print("\n💡 Recommended Actions:")
-    for action in result.actions:
-        print(f"  • {action}")
+    out.append("\n💡 Recommended Actions:")
+    out.extend(f"  • {action}" for action in result.actions)
     
-    print(f"\n{result.disclaimer}")
+    out.append(f"\n{result.disclaimer}")
     
     # Daily tasks
     tasks = assistant.daily_tasks()
-    print(f"\n📅 Daily Wellness Tasks:")
-    for task in tasks:
-        print(f"  • {task['task']} ({task['duration']})")
+    out.append(f"\n📅 Daily Wellness Tasks:")
+    out.extend(f"  • {task['task']} ({task['duration']})" for task in tasks)
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
+    assistant = PetVetAssist()
+    
     # Run tests
-    run_tests()
+    run_tests(assistant)
     
     # Demo consultations
     examples = [
@@ -228,4 +296,4 @@ if __name__ == "__main__":
     
     for example in examples:
         print("\n" + "="*60)
-        demo_consultation(example)
\ No newline at end of file
+        demo_consultation(example, assistant)
\ No newline at end of file